@@ -1476,12 +1476,12 @@ class TestCellComplex:
 
         assert len(CX.cells) == 4
         assert len(CX._cells._cells.keys()) == 2
-        assert sorted(list(CX._cells._cells[(1, 2, 3, 4)].keys())) == [0, 1, 2]
+        assert len(CX._cells._cells[(1, 2, 3, 4)]) == 3
 
         CX._delete_cell((1, 2, 3, 4), key=2)
         assert len(CX.cells) == 3
         assert len(CX._cells._cells.keys()) == 2
-        assert sorted(list(CX._cells._cells[(1, 2, 3, 4)].keys())) == [0, 1]
+        assert len(CX._cells._cells[(1, 2, 3, 4)]) == 2
 
         with pytest.raises(KeyError):
             CX._delete_cell((1, 2, 3, 4), key=10)
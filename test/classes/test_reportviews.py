@@ -4,7 +4,12 @@ import pytest
 
 from toponetx.classes.cell import Cell
 from toponetx.classes.cell_complex import CellComplex
+from toponetx.classes.combinatorial_complex import CombinatorialComplex
+from toponetx.classes.hyperedge import HyperEdge
 from toponetx.classes.reportviews import CellView, HyperEdgeView, NodeView, SimplexView
+from toponetx.classes.simplex import Simplex
+from toponetx.classes.simplicial_complex import SimplicialComplex
+from toponetx.exception import TopoNetXError
 
 
 class TestReportViews:
@@ -48,3 +53,147 @@ class TestReportViews:
             self.CV.__getitem__(1)
 
         assert str(exp_exception.value) == "Input must be a tuple, list or a cell."
+
+    def test_hyperedge_view_allranks(self):
+        """Test that the ranks of a HyperEdgeView are kept sorted."""
+        CC = CombinatorialComplex()
+        CC.add_cell([1, 2, 3, 4], rank=3)
+        CC.add_cell([1, 2], rank=1)
+        assert CC.cells.allranks == [0, 1, 3]
+        assert CC.cells._get_lower_rank(1) == 0
+        assert CC.cells._get_higher_rank(1) == 3
+        assert CC.cells._get_lower_rank(2) == 1
+        assert CC.cells._get_higher_rank(2) == 3
+        assert CC.cells._get_higher_rank(3) == -1
+
+        CC.remove_node(1)
+        CC.remove_node(2)
+        assert CC.cells.allranks == [0, 3]
+
+        # the returned list is a copy of the view's sorted ranks
+        CC.cells.allranks.remove(0)
+        assert CC.cells.allranks == [0, 3]
+        assert CC.ranks == [0, 3]
+
+    def test_hyperedge_view_get_rank(self):
+        """Test membership and rank lookup of a HyperEdgeView."""
+        CC = CombinatorialComplex()
+        CC.add_cell([1, 2], rank=1)
+        CC.add_cell([1, 2, 3], rank=2)
+        assert CC.cells.get_rank(1) == 0
+        assert CC.cells.get_rank([2, 1]) == 1
+        assert CC.cells.get_rank(HyperEdge([1, 2, 3])) == 2
+        assert 3 in CC.cells
+        assert (1, 3) not in CC.cells
+        with pytest.raises(KeyError):
+            CC.cells.get_rank([1, 3])
+
+        CC.remove_cell([1, 2, 3])
+        assert (1, 2, 3) not in CC.cells
+        with pytest.raises(KeyError):
+            CC.cells.get_rank([1, 2, 3])
+
+    def test_view_repr_is_truncated(self):
+        """Test that the string representation of large views is truncated."""
+        view = SimplexView()
+        view.faces_dict.append({frozenset({i}): {} for i in range(30)})
+        view.max_dim = 0
+        assert repr(view) == str(view)
+        assert repr(view).startswith("SimplexView([(0,), (1,),")
+        assert repr(view).endswith("(19,), ...])")
+
+        CC = CombinatorialComplex([[1, 2]], ranks=1)
+        assert repr(CC.cells) == "HyperEdgeView([(1, 2), (1,), (2,)])"
+
+    def test_view_len(self):
+        """Test that the length of the views follows insertions and removals."""
+        SC = SimplicialComplex([[1, 2, 3]])
+        assert len(SC.simplices) == 7
+        SC.remove_maximal_simplex([1, 2, 3])
+        assert len(SC.simplices) == 6
+
+        CC = CombinatorialComplex([[1, 2, 3]], ranks=2)
+        assert len(CC.cells) == 4
+        CC.remove_node(3)
+        assert len(CC.cells) == 3
+
+        view = SimplexView()
+        view.faces_dict.append({frozenset({1}): {}, frozenset({2}): {}})
+        view.max_dim = 0
+        assert len(view) == 2
+        assert len(view) == len(list(view))
+
+        CX = CellComplex()
+        CX._insert_cell((1, 2, 3))
+        CX._insert_cell((1, 2, 3))
+        CX._insert_cell((2, 3, 4))
+        assert len(CX.cells) == 3
+        CX._delete_cell((1, 2, 3), key=1)
+        assert len(CX.cells) == 2
+        CX._delete_cell((1, 2, 3))
+        assert len(CX.cells) == 1
+
+    def test_view_shape(self):
+        """Test that the shape of the views follows insertions and removals."""
+        SC = SimplicialComplex([[1, 2]])
+        assert SC.simplices.shape == (2, 1)
+        SC.add_simplex([1, 2, 3])
+        assert SC.simplices.shape == (3, 3, 1)
+        SC.remove_maximal_simplex([1, 2, 3])
+        assert SC.simplices.shape == (3, 3)
+
+        view = SimplexView()
+        assert view.shape == ()
+        view.faces_dict.append({frozenset({1}): {}})
+        assert view.shape == (1,)
+
+        CC = CombinatorialComplex([[1, 2]], ranks=1)
+        assert CC.cells.shape == (2, 1)
+        CC.add_cell([1, 2, 3], rank=2)
+        assert CC.cells.shape == (3, 1, 1)
+        CC.remove_node(3)
+        assert CC.cells.shape == (2, 1, 1)
+
+    def test_hyperedge_view_skeleton(self):
+        """Test the skeleton method of HyperEdgeView."""
+        CC = CombinatorialComplex()
+        CC.add_cell([1, 2], rank=1)
+        CC.add_cell([1, 2, 3], rank=2)
+        assert CC.cells.skeleton(1) == [frozenset({1, 2})]
+        assert CC.cells.skeleton(4) == []
+        assert CC.cells.skeleton(1, level="upper") == [
+            frozenset({1, 2}),
+            frozenset({1, 2, 3}),
+        ]
+        assert len(CC.cells.skeleton(1, level="down")) == 4
+        assert CC.cells.skeleton(1, level="down")[-1] == frozenset({1, 2})
+        with pytest.raises(TopoNetXError):
+            CC.cells.skeleton(1, level="sideways")
+
+    def test_views_accept_atoms(self):
+        """Test lookups of HyperEdge and Simplex instances in the views."""
+        SC = SimplicialComplex([[1, 2, 3]])
+        assert Simplex((1, 2)) in SC.simplices
+        assert Simplex((1, 4)) not in SC.simplices
+        assert Simplex((1,)) in SC.nodes
+
+        CC = CombinatorialComplex([[1, 2]], ranks=1)
+        assert HyperEdgeView._to_frozen_set(HyperEdge([1, 2])) == frozenset({1, 2})
+        assert CC.cells[HyperEdge([2, 1])] == {"weight": 1}
+
+    def test_empty_views(self):
+        """Test lookups in empty views."""
+        SC = SimplicialComplex()
+        assert 1 not in SC.simplices
+        assert (1, 2) not in SC.simplices
+        assert 1 not in SC.nodes
+        with pytest.raises(KeyError):
+            SC.simplices[(1,)]
+
+        CC = CombinatorialComplex()
+        assert 1 not in CC.cells
+        with pytest.raises(KeyError):
+            CC.cells[(1, 2)]
+
+        assert (1, 2, 3) not in CellComplex().cells
+        assert list(SimplexView()) == []
@@ -3,6 +3,7 @@
 import networkx as nx
 import pytest
 
+from toponetx.classes.simplicial_complex import SimplicialComplex
 from toponetx.transform.graph_to_simplicial_complex import (
     graph_2_clique_complex,
     graph_2_neighbor_complex,
@@ -90,3 +91,20 @@ class TestGraphToSimplicialComplex:
         assert sc.dim == 1
         assert (0, 2, 3) not in sc
         assert (0, 1, 2) not in sc
+
+    def test_graph_to_clique_complex_matches_incremental_construction(self):
+        """Test that the clique complex equals the one built simplex by simplex."""
+        G = nx.gnp_random_graph(20, 0.4, seed=3)
+        G.add_node(100)
+
+        sc = graph_to_clique_complex(G)
+        expected = SimplicialComplex(nx.enumerate_all_cliques(G))
+        assert sc.simplices.faces_dict == expected.simplices.faces_dict
+        assert sc.dim == expected.dim
+        assert len(sc.simplices) == len(expected.simplices)
+
+        sc = graph_to_clique_complex(G, max_dim=3)
+        expected = SimplicialComplex(
+            c for c in nx.enumerate_all_cliques(G) if len(c) <= 3
+        )
+        assert sc.simplices.faces_dict == expected.simplices.faces_dict
@@ -1,30 +1,90 @@
 __version__ = "0.0.2"
 
+import importlib
+
 from toponetx.exception import (
     TopoNetXError,
     TopoNetXException,
     TopoNetXNotImplementedError,
 )
 
-from .classes.cell import Cell
-from .classes.cell_complex import CellComplex
-from .classes.combinatorial_complex import CombinatorialComplex
-from .classes.complex import Complex
-from .classes.hyperedge import HyperEdge
-from .classes.reportviews import CellView, HyperEdgeView, NodeView, SimplexView
-from .classes.simplex import Simplex
-from .classes.simplicial_complex import SimplicialComplex
-from .datasets.graph import karate_club
-from .datasets.mesh import coseg, shrec_16, stanford_bunny
-from .transform.graph_to_cell_complex import homology_cycle_cell_complex
-from .transform.graph_to_simplicial_complex import (
-    graph_2_clique_complex,
-    graph_2_neighbor_complex,
-    graph_to_clique_complex,
-    graph_to_neighbor_complex,
-)
-from .utils.structure import (
-    neighborhood_list_to_neighborhood_dict,
-    sparse_array_to_neighborhood_dict,
-    sparse_array_to_neighborhood_list,
-)
+# Public objects are imported on first access (PEP 562), so that importing the
+# package does not pull in NumPy, SciPy and NetworkX through every submodule.
+_LAZY = {
+    "Cell": ("toponetx.classes.cell", "Cell"),
+    "CellComplex": ("toponetx.classes.cell_complex", "CellComplex"),
+    "CombinatorialComplex": (
+        "toponetx.classes.combinatorial_complex",
+        "CombinatorialComplex",
+    ),
+    "Complex": ("toponetx.classes.complex", "Complex"),
+    "HyperEdge": ("toponetx.classes.hyperedge", "HyperEdge"),
+    "CellView": ("toponetx.classes.reportviews", "CellView"),
+    "HyperEdgeView": ("toponetx.classes.reportviews", "HyperEdgeView"),
+    "NodeView": ("toponetx.classes.reportviews", "NodeView"),
+    "SimplexView": ("toponetx.classes.reportviews", "SimplexView"),
+    "Simplex": ("toponetx.classes.simplex", "Simplex"),
+    "SimplicialComplex": ("toponetx.classes.simplicial_complex", "SimplicialComplex"),
+    "karate_club": ("toponetx.datasets.graph", "karate_club"),
+    "coseg": ("toponetx.datasets.mesh", "coseg"),
+    "shrec_16": ("toponetx.datasets.mesh", "shrec_16"),
+    "stanford_bunny": ("toponetx.datasets.mesh", "stanford_bunny"),
+    "homology_cycle_cell_complex": (
+        "toponetx.transform.graph_to_cell_complex",
+        "homology_cycle_cell_complex",
+    ),
+    "graph_2_clique_complex": (
+        "toponetx.transform.graph_to_simplicial_complex",
+        "graph_2_clique_complex",
+    ),
+    "graph_2_neighbor_complex": (
+        "toponetx.transform.graph_to_simplicial_complex",
+        "graph_2_neighbor_complex",
+    ),
+    "graph_to_clique_complex": (
+        "toponetx.transform.graph_to_simplicial_complex",
+        "graph_to_clique_complex",
+    ),
+    "graph_to_neighbor_complex": (
+        "toponetx.transform.graph_to_simplicial_complex",
+        "graph_to_neighbor_complex",
+    ),
+    "neighborhood_list_to_neighborhood_dict": (
+        "toponetx.utils.structure",
+        "neighborhood_list_to_neighborhood_dict",
+    ),
+    "sparse_array_to_neighborhood_dict": (
+        "toponetx.utils.structure",
+        "sparse_array_to_neighborhood_dict",
+    ),
+    "sparse_array_to_neighborhood_list": (
+        "toponetx.utils.structure",
+        "sparse_array_to_neighborhood_list",
+    ),
+}
+
+_SUBMODULES = {"algorithms", "classes", "datasets", "transform", "utils"}
+
+__all__ = [
+    "TopoNetXError",
+    "TopoNetXException",
+    "TopoNetXNotImplementedError",
+    *_LAZY,
+]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module, attr = _LAZY[name]
+        obj = getattr(importlib.import_module(module), attr)
+    elif name in _SUBMODULES:
+        obj = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cache the object so that later accesses bypass `__getattr__`
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
@@ -293,35 +293,21 @@ class CellComplex(Complex):
     def _insert_cell(self, cell: tuple | list | Cell, **attr):
         """Insert cell."""
         # input must be list, tuple or Cell type
-        if isinstance(cell, tuple) or isinstance(cell, list) or isinstance(cell, Cell):
-            if isinstance(cell, tuple) or isinstance(cell, list):
-                cell = Cell(elements=cell, name=str(len(self.cells)), **attr)
-            elif isinstance(cell, Cell):
-                cell.update(attr)
-
-            if cell.elements not in self._cells._cells:
-                self._cells._cells[cell.elements] = {0: cell}
-            else:
-                # if cell is already in the complex, insert duplications and give it differnt key
-                self._cells._cells[cell.elements][
-                    len(self._cells._cells[cell.elements])
-                ] = cell
+        if isinstance(cell, Cell):
+            cell.update(attr)
+        elif isinstance(cell, (tuple, list)):
+            cell = Cell(elements=cell, name=str(len(self.cells)), **attr)
         else:
             raise TypeError("input must be list, tuple or Cell type")
 
+        # if cell is already in the complex, this inserts a duplicate with a different key
+        self._cells._register(cell)
+
     def _delete_cell(self, cell: tuple | list | Cell, key=None):
         """Delete cell."""
         if isinstance(cell, Cell):
             cell = cell.elements
-        if cell in self._cells._cells:
-            if key is None:
-                del self._cells._cells[cell]
-            elif key in self._cells._cells[cell]:
-                del self._cells._cells[cell][key]
-            else:
-                raise KeyError(f"cell with key {key} is not in the complex ")
-        else:
-            raise KeyError(f"cell {cell} is not in the complex")
+        self._cells._unregister(cell, key)
 
     def _cell_equivalence_class(self) -> dict[Cell, set[Cell]]:
         """Return the equivalence classes of cells in the cell complex.
@@ -384,16 +370,13 @@ class CellComplex(Complex):
         equiv_classes = self._cell_equivalence_class()
         for c in list(self.cells):
             if c not in equiv_classes:
-                d = self._cells._cells[c.elements]
-                if len(d) == 1:
+                cells = self._cells._cells[c.elements]
+                if isinstance(cells, Cell):
                     self._delete_cell(c)
                 else:
-                    d_c = dict(d)
-                    for k, v in d_c.items():
-                        if len(d) == 1:
-                            break
-                        else:
-                            self._delete_cell(c, k)
+                    # keep only the most recently inserted duplicate
+                    for _ in range(len(cells) - 1):
+                        self._delete_cell(c, 0)
 
     def degree(self, node: Hashable, rank: int = 1) -> int:
         """Compute the number of cells of certain rank that contain node.
@@ -578,7 +561,7 @@ class CellComplex(Complex):
         # Remove the node from the cell complex
         self._G.remove_node(node)
         # Remove any cells that contain the node
-        for cell in self.cells:
+        for cell in list(self.cells):
             if node in cell:
                 self.remove_cell(cell)
 
@@ -793,7 +776,7 @@ class CellComplex(Complex):
         -------
         cell complex : CellComplex
         """
-        for cell in self.cells:
+        for cell in list(self.cells):
             self.remove_cell(cell)
         return self
 
@@ -1346,7 +1329,7 @@ class CellComplex(Complex):
             where the index dictionaries map from the entity (as `Hashable` or `tuple`) to the row or col index of the matrix
         """
         node_index = {node: i for i, node in enumerate(sorted(self._G.nodes))}
-        edgelist = sorted([sorted(e) for e in self._G.edges])
+        edgelist = sorted(sorted(e) for e in self._G.edges)
         all_cell_index = {tuple(sorted(edge)): i for i, edge in enumerate(edgelist)}
         cell_index = {c.elements: i + len(edgelist) for i, c in enumerate(self.cells)}
         all_cell_index.update(cell_index)
@@ -1533,7 +1516,7 @@ class CellComplex(Complex):
             nodelist = sorted(
                 self._G.nodes
             )  # always output boundary matrix in dictionary order
-            edgelist = sorted([sorted(e) for e in self._G.edges])
+            edgelist = sorted(sorted(e) for e in self._G.edges)
             A = sp.sparse.lil_matrix((len(nodelist), len(edgelist)))
             node_index = {node: i for i, node in enumerate(nodelist)}
             for ei, e in enumerate(edgelist):
@@ -1554,7 +1537,7 @@ class CellComplex(Complex):
                 else:
                     return abs(A.asformat("csc"))
         elif rank == 2:
-            edgelist = sorted([sorted(e) for e in self._G.edges])
+            edgelist = sorted(sorted(e) for e in self._G.edges)
 
             A = sp.sparse.lil_matrix((len(edgelist), len(self.cells)))
 
@@ -331,7 +331,7 @@ class CombinatorialComplex(Complex):
     @property
     def ranks(self):
         """Return ranks."""
-        return sorted(self._complex_set.allranks)
+        return self._complex_set.allranks
 
     @property
     def dim(self) -> int:
@@ -491,18 +491,14 @@ class CombinatorialComplex(Complex):
         for key in list(self.cells.hyperedge_dict.keys()):
             for key_rank in list(self.cells.hyperedge_dict[key].keys()):
                 replace_key = key_rank.difference(node)
-                if len(replace_key) > 0:
-                    # Removing node removes all references to the node and leaves the remaining hyperedges untouched
-                    self.cells.hyperedge_dict[key][
-                        replace_key
-                    ] = self.cells.hyperedge_dict[key][key_rank]
-                    if key_rank != replace_key:
-                        del self.cells.hyperedge_dict[key][key_rank]
-                else:
-                    # Remove original hyperedge from the ranks
-                    del self.cells.hyperedge_dict[key][key_rank]
+                if key_rank != replace_key:
+                    attr = self.cells.hyperedge_dict[key][key_rank]
+                    self.cells._unregister(key_rank, key)
+                    if len(replace_key) > 0:
+                        # Removing node removes all references to the node and leaves the remaining hyperedges untouched
+                        self.cells._register(replace_key, key, attr)
             if self.cells.hyperedge_dict[key] == {}:
-                del self.cells.hyperedge_dict[key]
+                self.cells._remove_rank(key)
         # Removing nodes in Simplical Complex
         self._aux_complex.remove_nodes(node)
 
@@ -724,38 +720,18 @@ class CombinatorialComplex(Complex):
         -------
         None.
         """
-        if rank in self._complex_set.hyperedge_dict:
-            if hyperedge_ in self._complex_set.hyperedge_dict[rank]:
-                self._complex_set.hyperedge_dict[rank][hyperedge_].update(attr)
-                for i in hyperedge_:
-                    if 0 not in self._complex_set.hyperedge_dict:
-                        self._complex_set.hyperedge_dict[0] = {}
-
-                    if i not in self._complex_set.hyperedge_dict[0]:
-                        self._complex_set.hyperedge_dict[0][frozenset({i})] = {
-                            "weight": 1
-                        }
-            else:
-                self._complex_set.hyperedge_dict[rank][hyperedge_] = {}
-                self._complex_set.hyperedge_dict[rank][hyperedge_].update(attr)
-                for i in hyperedge_:
-                    if 0 not in self._complex_set.hyperedge_dict:
-                        self._complex_set.hyperedge_dict[0] = {}
-
-                    if i not in self._complex_set.hyperedge_dict[0]:
-                        self._complex_set.hyperedge_dict[0][frozenset({i})] = {
-                            "weight": 1
-                        }
-        else:
-            self._complex_set.hyperedge_dict[rank] = {}
-            self._complex_set.hyperedge_dict[rank][hyperedge_] = {}
+        if (
+            rank in self._complex_set.hyperedge_dict
+            and hyperedge_ in self._complex_set.hyperedge_dict[rank]
+        ):
             self._complex_set.hyperedge_dict[rank][hyperedge_].update(attr)
+        else:
+            self._complex_set._register(hyperedge_, rank, dict(attr))
 
-            for i in hyperedge_:
-                if 0 not in self._complex_set.hyperedge_dict:
-                    self._complex_set.hyperedge_dict[0] = {}
-                if i not in self._complex_set.hyperedge_dict[0]:
-                    self._complex_set.hyperedge_dict[0][frozenset({i})] = {"weight": 1}
+        self._complex_set._add_rank(0)
+        for i in hyperedge_:
+            if i not in self._complex_set.hyperedge_dict[0]:
+                self._complex_set._register(frozenset({i}), 0, {"weight": 1})
 
     def _add_hyperedge(self, hyperedge, rank: int, **attr):
         """Add hyperedge.
@@ -798,28 +774,20 @@ class CombinatorialComplex(Complex):
             if rank != 0:
                 raise ValueError(f"rank must be zero for string input, got rank {rank}")
             else:
-                if 0 not in self._complex_set.hyperedge_dict:
-                    self._complex_set.hyperedge_dict[0] = {}
-                self._complex_set.hyperedge_dict[0][frozenset({hyperedge})] = {}
-                self._complex_set.hyperedge_dict[0][frozenset({hyperedge})].update(attr)
+                self._complex_set._register(
+                    frozenset({hyperedge}), 0, {**attr, "weight": 1}
+                )
                 self._aux_complex.add_simplex(Simplex(frozenset({hyperedge}), r=0))
-                self._complex_set.hyperedge_dict[0][frozenset({hyperedge})][
-                    "weight"
-                ] = 1
                 return
 
         if isinstance(hyperedge, Hashable) and not isinstance(hyperedge, Iterable):
             if rank != 0:
                 raise ValueError(f"rank must be zero for hashables, got rank {rank}")
             else:
-                if 0 not in self._complex_set.hyperedge_dict:
-                    self._complex_set.hyperedge_dict[0] = {}
-                self._complex_set.hyperedge_dict[0][frozenset({hyperedge})] = {}
-                self._complex_set.hyperedge_dict[0][frozenset({hyperedge})].update(attr)
+                self._complex_set._register(
+                    frozenset({hyperedge}), 0, {**attr, "weight": 1}
+                )
                 self._aux_complex.add_simplex(Simplex(frozenset({hyperedge}), r=0))
-                self._complex_set.hyperedge_dict[0][frozenset({hyperedge})][
-                    "weight"
-                ] = 1
                 return
         if isinstance(hyperedge, Iterable) or isinstance(hyperedge, HyperEdge):
             if not isinstance(hyperedge, HyperEdge):
@@ -902,15 +870,7 @@ class CombinatorialComplex(Complex):
         if hyperedge not in self.cells:
             raise KeyError(f"The cell {hyperedge} is not in the complex")
 
-        if isinstance(hyperedge, Hashable) and not isinstance(hyperedge, Iterable):
-            del self._complex_set.hyperedge_dict[0][hyperedge]
-
-        if isinstance(hyperedge, HyperEdge):
-            hyperedge_ = hyperedge.elements
-        else:
-            hyperedge_ = frozenset(hyperedge)
-        rank = self._complex_set.get_rank(hyperedge_)
-        del self._complex_set.hyperedge_dict[rank][hyperedge_]
+        self._complex_set._unregister(HyperEdgeView._to_frozen_set(hyperedge))
 
     def _add_nodes_from(self, nodes) -> None:
         """Instantiate new nodes when cells are added to the CC.
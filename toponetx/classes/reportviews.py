@@ -3,8 +3,9 @@
 Such as:
 HyperEdgeView, CellView, SimplexView.
 """
+from bisect import bisect_left, bisect_right, insort
 from collections.abc import Collection, Hashable, Iterable, Iterator
-from itertools import chain
+from itertools import chain, islice
 from typing import Any
 
 import numpy as np
@@ -16,6 +17,31 @@ from toponetx.classes.simplex import Simplex
 
 __all__ = ["HyperEdgeView", "CellView", "SimplexView", "NodeView"]
 
+# maximum number of items shown in the string representation of a view
+_REPR_MAX_ITEMS = 20
+
+
+def _truncated_repr(name: str, items: Iterable, length: int) -> str:
+    """Return the string representation of a view, truncated to a few items.
+
+    Parameters
+    ----------
+    name : str
+        Name of the view class.
+    items : Iterable
+        Items of the view. Only the first `_REPR_MAX_ITEMS` are consumed.
+    length : int
+        Total number of items in the view.
+
+    Returns
+    -------
+    str
+    """
+    shown = list(islice(items, _REPR_MAX_ITEMS))
+    if length > _REPR_MAX_ITEMS:
+        return f"{name}([{', '.join(map(repr, shown))}, ...])"
+    return f"{name}({shown})"
+
 
 class CellView:
     """A CellView class for cells of a CellComplex.
@@ -26,14 +52,76 @@ class CellView:
         The name of the cell view.
     """
 
+    __slots__ = ("name", "_cells", "_len")
+
     def __init__(self, name: str = "") -> None:
         self.name = name
 
         # Initialize a dictionary to hold cells, with keys being the tuple
-        # that defines the cell, and values being dictionaries of cell objects
-        # with different properties
+        # that defines the cell, and values being the cell object, or a list of
+        # cell objects with different properties if there are several cells
+        # with the same elements
         self._cells = dict()
 
+        # number of cells in the view, kept in sync by `_register` and
+        # `_unregister`
+        self._len = 0
+
+    def _register(self, cell: Cell) -> None:
+        """Insert a cell into the view.
+
+        Cells with the same elements as an existing cell are stored next to it
+        under a new key.
+
+        Parameters
+        ----------
+        cell : Cell
+            The cell to insert.
+        """
+        cells = self._cells.get(cell.elements)
+        if cells is None:
+            self._cells[cell.elements] = cell
+        elif isinstance(cells, Cell):
+            self._cells[cell.elements] = [cells, cell]
+        else:
+            cells.append(cell)
+        self._len += 1
+
+    def _unregister(self, elements: tuple, key: int | None = None) -> None:
+        """Remove cells from the view.
+
+        Parameters
+        ----------
+        elements : tuple
+            The elements of the cell to remove.
+        key : int, optional
+            The position of the cell to remove among the cells with the same
+            elements, in insertion order. If None, all cells with these
+            elements are removed.
+
+        Raises
+        ------
+        KeyError
+            If the cell is not in the view.
+        """
+        if elements not in self._cells:
+            raise KeyError(f"cell {elements} is not in the complex")
+        cells = self._cells[elements]
+        n_cells = 1 if isinstance(cells, Cell) else len(cells)
+        if key is None:
+            self._len -= n_cells
+            del self._cells[elements]
+        elif isinstance(key, int) and 0 <= key < n_cells:
+            self._len -= 1
+            if n_cells == 1:
+                del self._cells[elements]
+            else:
+                del cells[key]
+                if len(cells) == 1:
+                    self._cells[elements] = cells[0]
+        else:
+            raise KeyError(f"cell with key {key} is not in the complex ")
+
     def __getitem__(self, cell):
         """Return the properties of a given cell.
 
@@ -52,40 +140,15 @@ class CellView:
         KeyError
             If the cell is not in the cell dictionary.
         """
-        if isinstance(cell, Cell):
-
-            if cell.elements not in self._cells:
-                raise KeyError(
-                    f"cell {cell.__repr__()} is not in the cell dictionary",
-                )
-
-            # If there is only one cell with these elements, return its properties
-            elif len(self._cells[cell.elements]) == 1:
-                k = next(iter(self._cells[cell.elements].keys()))
-                return self._cells[cell.elements][k]._properties
-
-            # If there are multiple cells with these elements, return the properties of all cells
-            else:
-                return [
-                    self._cells[cell.elements][c]._properties
-                    for c in self._cells[cell.elements]
-                ]
-
-        # If a tuple or list is passed in, assume it represents a cell
-        elif isinstance(cell, tuple) or isinstance(cell, list):
-
-            cell = tuple(cell)
-            if cell in self._cells:
-                if len(self._cells[cell]) == 1:
-                    k = next(iter(self._cells[cell].keys()))
-                    return self._cells[cell][k]._properties
-                else:
-                    return [self._cells[cell][c]._properties for c in self._cells[cell]]
-            else:
-                raise KeyError(f"cell {cell} is not in the cell dictionary")
-
-        else:
-            raise TypeError("Input must be a tuple, list or a cell.")
+        if isinstance(cell, Cell) and cell.elements not in self._cells:
+            raise KeyError(
+                f"cell {cell.__repr__()} is not in the cell dictionary",
+            )
+        cells = self.raw(cell)
+        if isinstance(cells, Cell):
+            return cells._properties
+        # If there are multiple cells with these elements, return the properties of all cells
+        return [c._properties for c in cells]
 
     def raw(self, cell: tuple | list | Cell) -> Cell | list[Cell]:
         """Indexes the raw cell objects analogous to the overall index of CellView.
@@ -108,50 +171,34 @@ class CellView:
             If the cell is not in the cell dictionary.
         """
         if isinstance(cell, Cell):
-
             if cell.elements not in self._cells:
                 raise KeyError(f"cell {cell} is not in the cell dictionary")
-
-            # If there is only one cell with these elements, return its properties
-            elif len(self._cells[cell.elements]) == 1:
-                k = next(iter(self._cells[cell.elements].keys()))
-                return self._cells[cell.elements][k]
-
-            # If there are multiple cells with these elements, return the properties of all cells
-            else:
-                return [
-                    self._cells[cell.elements][c] for c in self._cells[cell.elements]
-                ]
+            cells = self._cells[cell.elements]
 
         # If a tuple or list is passed in, assume it represents a cell
-        elif isinstance(cell, tuple) or isinstance(cell, list):
-
+        elif isinstance(cell, (tuple, list)):
             cell = tuple(cell)
-            if cell in self._cells:
-                if len(self._cells[cell]) == 1:
-                    k = next(iter(self._cells[cell].keys()))
-                    return self._cells[cell][k]
-                else:
-                    return [self._cells[cell][c] for c in self._cells[cell]]
-            else:
+            if cell not in self._cells:
                 raise KeyError(f"cell {cell} is not in the cell dictionary")
+            cells = self._cells[cell]
 
         else:
             raise TypeError("Input must be a tuple, list or a cell.")
 
+        # return a copy so that callers cannot modify the stored list of cells
+        return cells if isinstance(cells, Cell) else list(cells)
+
     def __len__(self) -> int:
         """Return the number of cells in the cell view."""
-        return sum(len(self._cells[cell]) for cell in self._cells)
+        return self._len
 
     def __iter__(self) -> Iterator:
         """Iterate over all cells in the cell view."""
-        return iter(
-            [
-                self._cells[cell][key]
-                for cell in self._cells
-                for key in self._cells[cell]
-            ]
-        )
+        for cells in self._cells.values():
+            if isinstance(cells, Cell):
+                yield cells
+            else:
+                yield from cells
 
     def __contains__(self, e: Any) -> bool:
         """Check if a given element is in the cell view.
@@ -166,18 +213,18 @@ class CellView:
         bool
             Whether or not the element is in the cell view.
         """
-        if not isinstance(e, Iterable):
+        if self._len == 0 or not hasattr(e, "__iter__"):
             return False
         e = tuple(e)
         return e in self._cells
 
     def __repr__(self) -> str:
         """Return a string representation of the cell view."""
-        return f"CellView({[self._cells[cell][key] for cell in self._cells for key in  self._cells[cell]] })"
+        return _truncated_repr("CellView", self, len(self))
 
     def __str__(self) -> str:
         """Return a string representation of the cell view."""
-        return f"CellView({[self._cells[cell][key] for cell in self._cells for key in  self._cells[cell]] })"
+        return _truncated_repr("CellView", self, len(self))
 
 
 class HyperEdgeView:
@@ -196,18 +243,122 @@ class HyperEdgeView:
     >>> hev = HyperEdgeView()
     """
 
+    __slots__ = (
+        "name",
+        "hyperedge_dict",
+        "_allranks",
+        "_rank_of",
+        "_len",
+        "_shape_cache",
+    )
+
     def __init__(self, name: str = "") -> None:
         self.name = name
         self.hyperedge_dict = {}
 
+        # sorted list of the keys of `hyperedge_dict`, kept in sync by
+        # `_add_rank` and `_remove_rank`
+        self._allranks = []
+
+        # maps every hyperedge to its rank and counts the hyperedges of all
+        # ranks, kept in sync by `_register` and `_unregister`
+        self._rank_of = {}
+        self._len = 0
+
+        # value of `shape`, computed on first access and reset whenever a
+        # rank or a hyperedge is added or removed
+        self._shape_cache = None
+
+    def _add_rank(self, rank: int) -> None:
+        """Add an empty rank to the view if it is not present yet.
+
+        Parameters
+        ----------
+        rank : int
+            The rank to add.
+        """
+        if rank not in self.hyperedge_dict:
+            self.hyperedge_dict[rank] = {}
+            insort(self._allranks, rank)
+            self._shape_cache = None
+
+    def _remove_rank(self, rank: int) -> None:
+        """Remove a rank and all its hyperedges from the view.
+
+        Parameters
+        ----------
+        rank : int
+            The rank to remove.
+        """
+        for hyperedge in list(self.hyperedge_dict[rank]):
+            self._unregister(hyperedge, rank)
+        del self.hyperedge_dict[rank]
+        del self._allranks[bisect_left(self._allranks, rank)]
+        self._shape_cache = None
+
+    def _register(self, hyperedge: frozenset, rank: int, attr: dict) -> None:
+        """Insert a hyperedge with the given rank and attributes into the view.
+
+        If the hyperedge is already present in that rank, its attributes are
+        replaced by `attr`.
+
+        Parameters
+        ----------
+        hyperedge : frozenset
+            The hyperedge to insert.
+        rank : int
+            The rank of the hyperedge.
+        attr : dict
+            The attributes of the hyperedge.
+        """
+        self._add_rank(rank)
+        if hyperedge not in self.hyperedge_dict[rank]:
+            self._len += 1
+            self._shape_cache = None
+        self.hyperedge_dict[rank][hyperedge] = attr
+        # the same set may be stored under several ranks, `get_rank` reports
+        # the lowest one
+        if rank < self._rank_of.get(hyperedge, rank + 1):
+            self._rank_of[hyperedge] = rank
+
+    def _unregister(self, hyperedge: frozenset, rank: int | None = None) -> None:
+        """Remove a hyperedge from the view.
+
+        Parameters
+        ----------
+        hyperedge : frozenset
+            The hyperedge to remove.
+        rank : int, optional
+            The rank to remove the hyperedge from. Defaults to the rank
+            returned by `get_rank`.
+
+        Raises
+        ------
+        KeyError
+            If the hyperedge is not in the view.
+        """
+        if rank is None:
+            rank = self._rank_of[hyperedge]
+        del self.hyperedge_dict[rank][hyperedge]
+        self._len -= 1
+        self._shape_cache = None
+
+        if self._rank_of[hyperedge] == rank:
+            del self._rank_of[hyperedge]
+            for r in self._allranks[bisect_right(self._allranks, rank) :]:
+                if hyperedge in self.hyperedge_dict[r]:
+                    self._rank_of[hyperedge] = r
+                    break
+
     @staticmethod
     def _to_frozen_set(hyperedge):
-        if isinstance(hyperedge, Iterable):
-            hyperedge_ = frozenset(hyperedge)
-        elif isinstance(hyperedge, HyperEdge):
+        # HyperEdge instances already store their elements as a frozenset
+        if isinstance(hyperedge, HyperEdge):
             hyperedge_ = hyperedge.elements
-        elif isinstance(hyperedge, Hashable) and not isinstance(hyperedge, Iterable):
-            hyperedge_ = frozenset([hyperedge])
+        elif hasattr(hyperedge, "__iter__"):
+            hyperedge_ = frozenset(hyperedge)
+        elif isinstance(hyperedge, Hashable):
+            hyperedge_ = frozenset((hyperedge,))
         else:
             hyperedge_ = frozenset(hyperedge)
         return hyperedge_
@@ -225,18 +376,25 @@ class HyperEdgeView:
         TYPE : dict or list or dicts
             return dict of properties associated with that hyperedges
         """
+        if self._len == 0:
+            raise KeyError(f"hyperedge {hyperedge} is not in the complex")
         hyperedge_ = HyperEdgeView._to_frozen_set(hyperedge)
-        rank = self.get_rank(hyperedge_)
-        return self.hyperedge_dict[rank][hyperedge_]
+        if hyperedge_ not in self._rank_of:
+            raise KeyError(f"hyperedge {hyperedge_} is not in the complex")
+        return self.hyperedge_dict[self._rank_of[hyperedge_]][hyperedge_]
 
     @property
     def shape(self) -> tuple[int, ...]:
         """Compute shape."""
-        return tuple(len(self.hyperedge_dict[i]) for i in self.allranks)
+        if self._shape_cache is None:
+            self._shape_cache = tuple(
+                len(self.hyperedge_dict[i]) for i in self._allranks
+            )
+        return self._shape_cache
 
     def __len__(self) -> int:
-        """Compute the number of nodes."""
-        return sum(self.shape)
+        """Compute the number of hyperedges."""
+        return self._len
 
     def __iter__(self) -> Iterator:
         """Iterate over the hyperedges."""
@@ -244,33 +402,27 @@ class HyperEdgeView:
 
     def __contains__(self, e: Collection) -> bool:
         """Check if e is in the hyperedges."""
-        if len(self.hyperedge_dict) == 0:
+        if self._len == 0:
             return False
 
-        if isinstance(e, Iterable):
-            if len(e) == 0:
-                return False
-            else:
-                for hyperedges in self.hyperedge_dict.values():
-                    if frozenset(e) in hyperedges:
-                        return True
-                return False
-
-        elif isinstance(e, HyperEdge):
-            if len(e) == 0:
-                return False
-            else:
-                for hyperedges in self.hyperedge_dict.values():
-                    if frozenset(e.elements) in hyperedges:
-                        return True
-                return False
-
-        elif isinstance(e, Hashable):
-            return frozenset({e}) in self.hyperedge_dict[0]
-
+        # single nodes are the most frequent query, e.g. during neighborhood
+        # traversals, so test for them first. Checking for `__iter__` directly
+        # is cheaper than going through `Iterable.__subclasshook__`.
+        if not hasattr(e, "__iter__") and isinstance(e, Hashable):
+            return frozenset((e,)) in self._rank_of
+
+        # reuse the frozenset stored on HyperEdge instances instead of
+        # rebuilding it from their elements
+        if isinstance(e, HyperEdge):
+            hyperedge_ = e.elements
+        elif hasattr(e, "__iter__"):
+            hyperedge_ = frozenset(e)
         else:
+            return False
 
+        if len(hyperedge_) == 0:
             return False
+        return hyperedge_ in self._rank_of
 
     def __repr__(self) -> str:
         """Return string representation of hyperedges.
@@ -279,7 +431,7 @@ class HyperEdgeView:
         -------
         str
         """
-        return f"HyperEdgeView([{map(tuple, self)}])"
+        return _truncated_repr("HyperEdgeView", map(tuple, self), len(self))
 
     def __str__(self) -> str:
         """Return string representation of hyperedges.
@@ -288,36 +440,36 @@ class HyperEdgeView:
         -------
         str
         """
-        return f"HyperEdgeView([{map(tuple, self)}])"
+        return _truncated_repr("HyperEdgeView", map(tuple, self), len(self))
 
     def skeleton(self, rank, level=None):
-        """Skeleton of the complex."""
-        if level is None or level == "equal":
-            elements = []
-            if rank in self.allranks:
+        """Skeleton of the complex.
 
-                return sorted(list(self.hyperedge_dict[rank].keys()))
-            else:
-                return []
+        Parameters
+        ----------
+        rank : int
+            The rank of the skeleton.
+        level : str, optional
+            One of None or "equal" for the hyperedges of rank `rank`, "upper" or
+            "up" for the hyperedges of rank at least `rank`, and "lower" or "down"
+            for the hyperedges of rank at most `rank`.
 
+        Returns
+        -------
+        list of frozensets
+            The hyperedges of the skeleton, grouped by ascending rank.
+        """
+        if level is None or level == "equal":
+            ranks = [rank] if rank in self.hyperedge_dict else []
         elif level == "upper" or level == "up":
-            elements = []
-            for rank in self.allranks:
-                if rank >= rank:
-
-                    elements = elements + list(self.hyperedge_dict[rank].keys())
-            return sorted(elements)
-
+            ranks = self._allranks[bisect_left(self._allranks, rank) :]
         elif level == "lower" or level == "down":
-            elements = []
-            for rank in self.allranks:
-                if rank <= rank:
-                    elements = elements + list(self.hyperedge_dict[rank].keys())
-            return sorted(elements)
+            ranks = self._allranks[: bisect_right(self._allranks, rank)]
         else:
             raise TopoNetXError(
                 "level must be None, equal, 'upper', 'lower', 'up', or 'down' "
             )
+        return list(chain.from_iterable(sorted(self.hyperedge_dict[r]) for r in ranks))
 
     def get_rank(self, e):
         """Get rank.
@@ -330,61 +482,43 @@ class HyperEdgeView:
         -------
         int, the rank of the hyperedge e
         """
-        if isinstance(e, Iterable):
-            if len(e) == 0:
-                return 0
-            else:
-                for i in list(self.allranks):
-                    if frozenset(e) in self.hyperedge_dict[i]:
-                        return i
-                raise KeyError(f"hyperedge {e} is not in the complex")
-
-        elif isinstance(e, HyperEdge):
-
-            if len(e) == 0:
-                return 0
-            else:
-                for i in list(self.allranks):
-
-                    if frozenset(e.elements) in self.hyperedge_dict[i]:
-                        return i
-                raise KeyError(f"hyperedge {e} is not in the complex")
-
-        elif isinstance(e, Hashable) and not isinstance(e, Iterable):
-
-            if e in self.hyperedge_dict[0]:
-                return 0
-            else:
-                raise KeyError(f"hyperedge {e} is not in the complex")
-
-        elif isinstance(e, str):
+        if isinstance(e, HyperEdge):
+            hyperedge_ = e.elements
+        elif hasattr(e, "__iter__"):
+            hyperedge_ = frozenset(e)
+        elif isinstance(e, Hashable):
+            hyperedge_ = frozenset((e,))
+        else:
+            raise KeyError(f"hyperedge {e} is not in the complex")
 
-            if e in self.hyperedge_dict[0]:
-                return 0
-            else:
-                raise KeyError(f"hyperedge {e} is not in the complex")
+        if len(hyperedge_) == 0:
+            return 0
+        if hyperedge_ not in self._rank_of:
+            raise KeyError(f"hyperedge {e} is not in the complex")
+        return self._rank_of[hyperedge_]
 
     @property
     def allranks(self):
-        """All ranks."""
-        return sorted(list(self.hyperedge_dict.keys()))
+        """All ranks, in ascending order.
 
-    def _get_lower_rank(self, rank):
-        if len(self.allranks) == 0:
-            return -1
+        Returns a new list, so changing it does not affect the view.
+        """
+        return list(self._allranks)
 
-        ranks = sorted(self.allranks)
-        if rank <= min(ranks) or rank >= max(ranks):
+    def _get_lower_rank(self, rank):
+        ranks = self._allranks
+        # `ranks` is sorted, so its extremes are its first and last entries
+        if len(ranks) == 0 or rank <= ranks[0] or rank >= ranks[-1]:
             return -1
-        return ranks[ranks.index(rank) - 1]
+        # last rank strictly below `rank`, whether or not `rank` is present
+        return ranks[bisect_left(ranks, rank) - 1]
 
     def _get_higher_rank(self, rank):
-        if len(self.allranks) == 0:
-            return -1
-        ranks = sorted(self.allranks)
-        if rank <= min(ranks) or rank >= max(ranks):
+        ranks = self._allranks
+        if len(ranks) == 0 or rank <= ranks[0] or rank >= ranks[-1]:
             return -1
-        return ranks[ranks.index(rank) + 1]
+        # first rank strictly above `rank`, whether or not `rank` is present
+        return ranks[bisect_right(ranks, rank)]
 
 
 class SimplexView:
@@ -408,12 +542,65 @@ class SimplexView:
         A list containing dictionaries of faces for each dimension.
     """
 
+    __slots__ = ("name", "max_dim", "faces_dict")
+
     def __init__(self, name: str = "") -> None:
         self.name = name
 
         self.max_dim = -1
         self.faces_dict = []
 
+    def _register(self, simplex: frozenset, attr: dict) -> None:
+        """Insert a simplex with the given attributes into the view.
+
+        If the simplex is already present, its attributes are replaced by
+        `attr`. `faces_dict` must already have an entry for the dimension of
+        the simplex.
+
+        Parameters
+        ----------
+        simplex : frozenset
+            The simplex to insert.
+        attr : dict
+            The attributes of the simplex.
+        """
+        self.faces_dict[len(simplex) - 1][simplex] = attr
+
+    def _unregister(self, simplex: frozenset) -> None:
+        """Remove a simplex from the view.
+
+        Parameters
+        ----------
+        simplex : frozenset
+            The simplex to remove.
+
+        Raises
+        ------
+        KeyError
+            If the simplex is not in the view.
+        """
+        del self.faces_dict[len(simplex) - 1][simplex]
+
+    def _bulk_register(
+        self, simplices: Collection[frozenset], attrs: Iterable[dict]
+    ) -> None:
+        """Insert many simplices of the same dimension into the view at once.
+
+        `faces_dict` must already have an entry for the dimension of the
+        simplices.
+
+        Parameters
+        ----------
+        simplices : Collection of frozensets
+            Distinct simplices of the same dimension that are not in the view yet.
+        attrs : Iterable of dicts
+            The attributes of the simplices, in the same order as `simplices`.
+        """
+        if len(simplices) == 0:
+            return
+        faces = self.faces_dict[len(next(iter(simplices))) - 1]
+        faces.update(zip(simplices, attrs))
+
     def __getitem__(self, simplex):
         """Get the dictionary of properties associated with the given simplex.
 
@@ -427,19 +614,25 @@ class SimplexView:
         dict or list or dict
             A dictionary of properties associated with the given simplex.
         """
+        if len(self.faces_dict) == 0:
+            raise KeyError(f"input {simplex} is not in the simplex dictionary")
+
         if isinstance(simplex, Simplex):
-            if simplex.elements in self.faces_dict[len(simplex) - 1]:
-                return self.faces_dict[len(simplex) - 1][simplex.elements]
-        elif isinstance(simplex, Iterable):
+            faces = self.faces_dict[len(simplex) - 1]
+            if simplex.elements in faces:
+                return faces[simplex.elements]
+        elif hasattr(simplex, "__iter__"):
             simplex = frozenset(simplex)
-            if simplex in self.faces_dict[len(simplex) - 1]:
-                return self.faces_dict[len(simplex) - 1][simplex]
+            faces = self.faces_dict[len(simplex) - 1]
+            if simplex in faces:
+                return faces[simplex]
             else:
                 raise KeyError(f"input {simplex} is not in the simplex dictionary")
 
         elif isinstance(simplex, Hashable):
-            if frozenset({simplex}) in self:
-                return self.faces_dict[0][frozenset({simplex})]
+            simplex = frozenset((simplex,))
+            if simplex in self.faces_dict[0]:
+                return self.faces_dict[0][simplex]
 
     @property
     def shape(self) -> tuple[int, ...]:
@@ -450,11 +643,14 @@ class SimplexView:
         tuple of ints
             A tuple of integers representing the number of simplices in each dimension.
         """
-        return tuple(len(self.faces_dict[i]) for i in range(len(self.faces_dict)))
+        # not cached, as `faces_dict` may be filled directly
+        return tuple(len(faces) for faces in self.faces_dict)
 
     def __len__(self) -> int:
         """Return the number of simplices in the SimplexView instance."""
-        return sum(self.shape)
+        # `faces_dict` is public and may be filled directly, so count its
+        # entries instead of keeping a counter; this is O(max_dim)
+        return sum(len(faces) for faces in self.faces_dict)
 
     def __iter__(self) -> Iterator:
         """Return an iterator over all simplices in the simplex view."""
@@ -496,35 +692,33 @@ class SimplexView:
         >>> {1, 2, 3} in view
         False
         """
-        if isinstance(item, Iterable):
-            item = frozenset(item)
+        if len(self.faces_dict) == 0:
+            return False
+
+        if hasattr(item, "__iter__"):
+            # Simplex instances already store their elements as a frozenset
+            item = item.elements if isinstance(item, Simplex) else frozenset(item)
             if not 0 < len(item) <= self.max_dim + 1:
                 return False
             return item in self.faces_dict[len(item) - 1]
         elif isinstance(item, Hashable):
-            return frozenset({item}) in self.faces_dict[0]
+            return frozenset((item,)) in self.faces_dict[0]
         return False
 
     def __repr__(self) -> str:
         """Return string representation that can be used to recreate it."""
-        all_simplices: list[tuple[int, ...]] = []
-        for i in range(len(self.faces_dict)):
-            all_simplices += [tuple(j) for j in self.faces_dict[i]]
-
-        return f"SimplexView({all_simplices})"
+        return _truncated_repr("SimplexView", map(tuple, self), len(self))
 
     def __str__(self) -> str:
         """Return detailed string representation of the simplex view."""
-        all_simplices: list[tuple[int, ...]] = []
-        for i in range(len(self.faces_dict)):
-            all_simplices += [tuple(j) for j in self.faces_dict[i]]
-
-        return f"SimplexView({all_simplices})"
+        return _truncated_repr("SimplexView", map(tuple, self), len(self))
 
 
 class NodeView:
     """Node view class."""
 
+    __slots__ = ("name", "nodes", "cell_type")
+
     def __init__(self, objectdict, cell_type, name: str = "") -> None:
         self.name = name
         if len(objectdict) != 0:
@@ -544,9 +738,7 @@ class NodeView:
         -------
         str
         """
-        all_nodes = [tuple(j) for j in self.nodes.keys()]
-
-        return f"NodeView({all_nodes})"
+        return _truncated_repr("NodeView", map(tuple, self.nodes), len(self))
 
     def __getitem__(self, cell):
         """Get item.
@@ -564,7 +756,7 @@ class NodeView:
         if isinstance(cell, self.cell_type):
             if cell.elements in self.nodes:
                 return self.nodes[cell.elements]
-        elif isinstance(cell, Iterable):
+        elif hasattr(cell, "__iter__"):
             cell = frozenset(cell)
             if cell in self.nodes:
                 return self.nodes[cell]
@@ -575,7 +767,7 @@ class NodeView:
 
             if cell in self:
 
-                return self.nodes[frozenset({cell})]
+                return self.nodes[frozenset((cell,))]
 
     def __len__(self) -> int:
         """Compute the number of nodes."""
@@ -583,13 +775,16 @@ class NodeView:
 
     def __contains__(self, e) -> bool:
         """Check if e is in the nodes."""
+        if len(self.nodes) == 0:
+            return False
+
         if isinstance(e, Hashable) and not isinstance(e, self.cell_type):
-            return frozenset({e}) in self.nodes
+            return frozenset((e,)) in self.nodes
 
         elif isinstance(e, self.cell_type):
             return e.elements in self.nodes
 
-        elif isinstance(e, Iterable):
+        elif hasattr(e, "__iter__"):
             if len(e) == 1:
                 return frozenset(e) in self.nodes
         else:
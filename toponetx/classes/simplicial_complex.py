@@ -3,7 +3,8 @@
 The class also supports attaching arbitrary attributes and data to cells.
 """
 
-from collections.abc import Hashable, Iterable, Iterator
+from collections import defaultdict
+from collections.abc import Collection, Hashable, Iterable, Iterator
 from itertools import chain, combinations
 from warnings import warn
 
@@ -282,28 +283,26 @@ class SimplicialComplex(Complex):
         face = frozenset(face)
         k = len(face)
 
-        if face not in self._simplex_set.faces_dict[k - 1]:
+        # look the face up once; its attribute dict is then updated in place
+        entry = self._simplex_set.faces_dict[k - 1].get(face)
+        if entry is None:
             if k == len(simplex):
-                self._simplex_set.faces_dict[k - 1][face] = {
-                    "is_maximal": True,
-                    "membership": set(),
-                }
+                self._simplex_set._register(
+                    face, {"is_maximal": True, "membership": set()}
+                )
             else:
-                self._simplex_set.faces_dict[k - 1][face] = {
-                    "is_maximal": False,
-                    "membership": {simplex},
-                }
+                self._simplex_set._register(
+                    face, {"is_maximal": False, "membership": {simplex}}
+                )
         else:
             if k != len(simplex):
-                self._simplex_set.faces_dict[k - 1][face]["membership"].add(simplex)
-                if self._simplex_set.faces_dict[k - 1][face]["is_maximal"]:
+                entry["membership"].add(simplex)
+                if entry["is_maximal"]:
                     maximal_faces.add(face)
-                    self._simplex_set.faces_dict[k - 1][face]["is_maximal"] = False
+                    entry["is_maximal"] = False
                 else:
                     # make sure all children of previous maximal simplices do not have that membership anymore
-                    self._simplex_set.faces_dict[k - 1][face][
-                        "membership"
-                    ] -= maximal_faces
+                    entry["membership"] -= maximal_faces
 
     @staticmethod
     def get_boundaries(
@@ -372,7 +371,7 @@ class SimplicialComplex(Complex):
                 simplex_ = simplex.elements
         if simplex_ in self._simplex_set.faces_dict[len(simplex_) - 1]:
             if self.is_maximal(simplex):
-                del self._simplex_set.faces_dict[len(simplex_) - 1][simplex_]
+                self._simplex_set._unregister(simplex_)
                 faces = Simplex(simplex_).faces
                 for s in faces:
                     if len(s) == len(simplex_):
@@ -504,6 +503,69 @@ class SimplicialComplex(Complex):
         for s in simplices:
             self.add_simplex(s)
 
+    def _add_closed_simplices_from(self, simplices: Iterable[Collection]) -> None:
+        """Add a collection of simplices that is closed under taking faces.
+
+        This is a faster alternative to `add_simplices_from` when every face of
+        every input simplex is part of the input as well, e.g. for the cliques
+        of a graph. Instead of updating the faces of each simplex one after the
+        other, the maximal simplices and the memberships of their faces are
+        computed once and every dimension is inserted in one go.
+
+        Parameters
+        ----------
+        simplices : Iterable of Collections
+            The simplices to add. Must be closed under taking faces.
+
+        Raises
+        ------
+        ValueError
+            If the simplicial complex is not empty or a simplex contains
+            duplicate nodes.
+        """
+        if len(self._simplex_set) != 0:
+            raise ValueError("simplices can only be added in bulk to an empty complex")
+
+        # distinct simplices of each dimension, in insertion order
+        simplices_by_dim: list[dict[frozenset, None]] = []
+        for simplex in simplices:
+            simplex_ = frozenset(simplex)
+            if len(simplex_) != len(simplex):
+                raise ValueError("a simplex cannot contain duplicate nodes")
+            if len(simplices_by_dim) < len(simplex_):
+                self._update_faces_dict_length(simplex_)
+                while len(simplices_by_dim) < len(simplex_):
+                    simplices_by_dim.append({})
+            simplices_by_dim[len(simplex_) - 1][simplex_] = None
+
+        # a simplex is maximal iff it is not a facet of a simplex one dimension up
+        non_maximal = set()
+        for dim_simplices in simplices_by_dim[1:]:
+            for simplex_ in dim_simplices:
+                non_maximal.update(simplex_ - {node} for node in simplex_)
+
+        membership = defaultdict(set)
+        for dim_simplices in simplices_by_dim:
+            for simplex_ in dim_simplices:
+                if simplex_ in non_maximal:
+                    continue
+                for r in range(1, len(simplex_)):
+                    for face in combinations(simplex_, r):
+                        membership[frozenset(face)].add(simplex_)
+
+        for dim_simplices in simplices_by_dim:
+            self._simplex_set._bulk_register(
+                dim_simplices,
+                (
+                    {
+                        "is_maximal": simplex_ not in non_maximal,
+                        "membership": membership.get(simplex_, set()),
+                    }
+                    for simplex_ in dim_simplices
+                ),
+            )
+        self._simplex_set.max_dim = len(simplices_by_dim) - 1
+
     def get_cofaces(self, simplex, codimension):
         """Get cofaces of simplex.
 
@@ -717,20 +779,19 @@ class SimplicialComplex(Complex):
             )
             boundary[0, 0 : len(self._simplex_set.faces_dict[rank].items())] = 1
             return boundary.tocsr()
-        idx_simplices, idx_faces, values = [], [], []
-
         simplex_dict_d = {simplex: i for i, simplex in enumerate(self.skeleton(rank))}
         simplex_dict_d_minus_1 = {
             simplex: i for i, simplex in enumerate(self.skeleton(rank - 1))
         }
-        for simplex, idx_simplex in simplex_dict_d.items():
-            # for simplex, idx_simplex in self._simplex_set.faces_dict[d].items():
-            for i, left_out in enumerate(np.sort(list(simplex))):
-                idx_simplices.append(idx_simplex)
-                values.append((-1) ** i)
-                face = frozenset(simplex).difference({left_out})
-                idx_faces.append(simplex_dict_d_minus_1[tuple(sorted(face))])
-        assert len(values) == (rank + 1) * len(simplex_dict_d)
+        # the skeleton consists of sorted tuples, so leaving out the i-th node of a
+        # simplex directly gives the sorted tuple of the corresponding face
+        idx_faces = [
+            simplex_dict_d_minus_1[simplex[:i] + simplex[i + 1 :]]
+            for simplex in simplex_dict_d
+            for i in range(rank + 1)
+        ]
+        idx_simplices = np.repeat(np.arange(len(simplex_dict_d)), rank + 1)
+        values = np.tile((-1.0) ** np.arange(rank + 1), len(simplex_dict_d))
         boundary = coo_matrix(
             (values, (idx_faces, idx_simplices)),
             dtype=np.float32,
@@ -1,5 +1,6 @@
 """Methods to lift a graph to a simplicial complex."""
 
+from itertools import takewhile
 from warnings import warn
 
 import networkx as nx
@@ -58,9 +59,13 @@ def graph_to_clique_complex(
     """
     cliques = nx.enumerate_all_cliques(G)
     if max_dim is not None:
-        cliques = filter(lambda clique: len(clique) <= max_dim, cliques)
+        # cliques are enumerated in nondecreasing order of size
+        cliques = takewhile(lambda clique: len(clique) <= max_dim, cliques)
 
-    return SimplicialComplex(cliques)
+    # the cliques of a graph are closed under taking faces
+    SC = SimplicialComplex()
+    SC._add_closed_simplices_from(cliques)
+    return SC
 
 
 def graph_2_neighbor_complex(G) -> SimplicialComplex: